@@ -15,7 +15,14 @@ REST API Basics:
 You can switch between different API servers below!
 """
 
-import requests  # This library helps us make HTTP requests
+import atexit
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
 
 # =============================================================================
 # 🔧 CONFIGURE YOUR API URL HERE
@@ -31,80 +38,231 @@ import requests  # This library helps us make HTTP requests
 # Option 3: Your Render deployment (default - YOUR API!)
 API_URL = "https://api-playground-zita.onrender.com/objects"
 
+# How many requests get_objects_bulk() may have in flight at the same time
+MAX_WORKERS = 10
+
+# =============================================================================
+# 🔌 SHARED HTTP SESSION
+# =============================================================================
+# A Session keeps the TCP/TLS connection open between calls (keep-alive),
+# so only the first request pays for the handshake. Every helper below
+# reuses this one session instead of calling requests.get() etc. directly.
+#
+# It is also a *cached* session: GET responses are saved to a small SQLite
+# file in your user cache folder. Next time we send the server the saved
+# ETag, and if the data hasn't changed it answers "304 Not Modified" with
+# no body - we reuse our saved copy instead of downloading it again.
+
+SESSION = CachedSession(
+    "api_playground_cache",
+    backend="sqlite",
+    use_cache_dir=True,       # e.g. ~/.cache/ instead of the current folder
+    cache_control=True,       # follow the server's Cache-Control headers
+    always_revalidate=True,   # always check with the server, never serve stale data
+    expire_after=300,         # forget saved responses after 5 minutes
+)
+
+# Retry briefly on gateway errors (e.g. while a free Render instance wakes up).
+# raise_on_status=False: if the error persists, hand back the last response
+# so our functions can report its status code as usual.
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=MAX_WORKERS,  # one pooled connection per bulk worker
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+SESSION.headers.update({
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",  # let the server compress responses
+    "Connection": "keep-alive",
+})
+
+# (connect timeout, read timeout) in seconds - without this a stalled
+# server would make a call hang forever. The read timeout is generous
+# because a sleeping free Render instance can take a minute to wake up.
+TIMEOUT = (3.05, 60)
+
+# Threads for fetching many objects at once. Network calls spend most of
+# their time waiting, so threads can overlap that waiting. The session's
+# connection pool is thread-safe, so all workers share SESSION.
+_POOL = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Close the pooled connections when the script exits
+atexit.register(SESSION.close)
+atexit.register(_POOL.shutdown)
+
 # =============================================================================
+# 📝 OUTPUT
+# =============================================================================
+# The functions below stay quiet by default, so other programs can import
+# and use them. Pass verbose=True to see the step-by-step explanations
+# (the demo does). Short status messages also go to the "api_playground"
+# logger - turn them on with: logging.basicConfig(level=logging.INFO)
+
+LOG = logging.getLogger("api_playground")
+LOG.addHandler(logging.NullHandler())
+
+_SEP = "=" * 50
+_RULE = "-" * 40
 
 
-def get_all_objects():
+def _banner(title):
+    """Print a section title between two separator lines."""
+    print("\n" + _SEP)
+    print(title)
+    print(_SEP)
+
+
+# =============================================================================
+
+
+def get_all_objects(verbose=False):
     """
     GET all objects from the API.
     
     This is like asking: "Show me everything you have!"
     The API returns a list of all products in its database.
     """
-    print("\n" + "=" * 50)
-    print("📚 FETCHING ALL OBJECTS FROM API")
-    print("=" * 50)
+    if verbose:
+        _banner("📚 FETCHING ALL OBJECTS FROM API")
     
     # Make a GET request to the API
-    response = requests.get(API_URL)
+    response = SESSION.get(API_URL, timeout=TIMEOUT)
     
     # Check if the request was successful (status code 200 means OK)
     if response.status_code == 200:
         objects = response.json()  # Convert JSON response to Python list
-        print(f"✅ Success! Found {len(objects)} objects.\n")
+        LOG.info("Fetched %d objects", len(objects))
         
-        # Display first 5 objects to keep output readable
-        for obj in objects[:5]:
-            print(f"  ID: {obj['id']}")
-            print(f"  Name: {obj['name']}")
-            print(f"  Data: {obj.get('data', 'No additional data')}")
-            print("-" * 40)
-        
-        if len(objects) > 5:
-            print(f"  ... and {len(objects) - 5} more objects")
+        if verbose:
+            print(f"✅ Success! Found {len(objects)} objects.\n")
+            
+            # Display first 5 objects to keep output readable
+            for obj in objects[:5]:
+                print(f"  ID: {obj['id']}")
+                print(f"  Name: {obj['name']}")
+                print(f"  Data: {obj.get('data', 'No additional data')}")
+                print(_RULE)
+            
+            if len(objects) > 5:
+                print(f"  ... and {len(objects) - 5} more objects")
         
         return objects
     else:
-        print(f"❌ Error: Could not fetch data. Status code: {response.status_code}")
+        LOG.warning("Could not fetch objects: HTTP %d", response.status_code)
+        if verbose:
+            print(f"❌ Error: Could not fetch data. Status code: {response.status_code}")
         return None
 
 
-def get_single_object(object_id):
+def stream_all_objects(verbose=False):
+    """
+    GET all objects as a stream, one object per line (NDJSON).
+    
+    This is like reading a list while it's still being written: we can
+    show the first item before the server has even sent the last one.
+    """
+    if verbose:
+        _banner("🌊 STREAMING ALL OBJECTS FROM API")
+    
+    # stream=True: don't download everything first, hand us lines as they arrive
+    url = f"{API_URL}.ndjson"
+    with SESSION.get(url, stream=True, timeout=TIMEOUT) as response:
+        if response.status_code != 200:
+            LOG.warning("Could not stream objects: HTTP %d", response.status_code)
+            if verbose:
+                print(f"❌ Error: Could not stream data. Status code: {response.status_code}")
+            return None
+        
+        objects = []
+        for line in response.iter_lines():
+            if not line:
+                continue
+            obj = json.loads(line)  # each line is one complete JSON object
+            objects.append(obj)
+            if verbose:
+                print(f"  ID: {obj['id']} → {obj['name']}")
+    
+    LOG.info("Streamed %d objects", len(objects))
+    if verbose:
+        print(f"\n✅ Success! Streamed {len(objects)} objects.")
+    return objects
+
+
+def get_single_object(object_id, verbose=False):
     """
     GET a single object by its ID.
     
     This is like asking: "Show me just this one specific item!"
     """
-    print("\n" + "=" * 50)
-    print(f"🔍 FETCHING OBJECT WITH ID: {object_id}")
-    print("=" * 50)
+    if verbose:
+        _banner(f"🔍 FETCHING OBJECT WITH ID: {object_id}")
     
     # Add the ID to the URL to get a specific object
     url = f"{API_URL}/{object_id}"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=TIMEOUT)
     
     if response.status_code == 200:
         obj = response.json()
-        print(f"✅ Found it!\n")
-        print(f"  ID: {obj['id']}")
-        print(f"  Name: {obj['name']}")
-        print(f"  Data: {obj.get('data', 'No additional data')}")
+        LOG.info("Fetched object %s", object_id)
+        if verbose:
+            print(f"✅ Found it!\n")
+            print(f"  ID: {obj['id']}")
+            print(f"  Name: {obj['name']}")
+            print(f"  Data: {obj.get('data', 'No additional data')}")
         return obj
     else:
-        print(f"❌ Error: Object not found. Status code: {response.status_code}")
+        LOG.warning("Could not fetch object %s: HTTP %d", object_id, response.status_code)
+        if verbose:
+            print(f"❌ Error: Object not found. Status code: {response.status_code}")
         return None
 
 
-def create_object(name, data=None):
+def get_objects_bulk(ids, verbose=False):
+    """
+    GET several objects by ID, in parallel.
+    
+    This is like asking: "Show me all of these items - and don't make me
+    wait for them one at a time!"
+    Results come back in the same order as 'ids' (None for missing objects).
+    """
+    ids = list(ids)
+    if verbose:
+        _banner(f"📦 FETCHING {len(ids)} OBJECTS IN PARALLEL")
+    
+    # map() runs get_single_object on the pool's threads but keeps the input
+    # order. Each call stays quiet, so we print one summary at the end.
+    objects = list(_POOL.map(get_single_object, ids))
+    
+    found = sum(obj is not None for obj in objects)
+    LOG.info("Fetched %d of %d objects", found, len(ids))
+    if verbose:
+        print(f"✅ Found {found} of {len(ids)} objects.\n")
+        for object_id, obj in zip(ids, objects):
+            if obj is None:
+                print(f"  ID: {object_id} → ❌ not found")
+            else:
+                print(f"  ID: {obj['id']} → {obj['name']}")
+    
+    return objects
+
+
+def create_object(name, data=None, verbose=False):
     """
     POST a new object to the API.
     
     This is like saying: "Please add this new item to your database!"
     We send the data we want to create, and the API gives it an ID.
     """
-    print("\n" + "=" * 50)
-    print("➕ CREATING A NEW OBJECT")
-    print("=" * 50)
+    if verbose:
+        _banner("➕ CREATING A NEW OBJECT")
     
     # The data we want to send to create a new object
     new_object = {
@@ -112,35 +270,70 @@ def create_object(name, data=None):
         "data": data
     }
     
-    print(f"Sending: {new_object}")
+    if verbose:
+        print(f"Sending: {new_object}")
     
     # Make a POST request with our data
     # We use 'json=' to automatically convert our dict to JSON
-    response = requests.post(API_URL, json=new_object)
+    response = SESSION.post(API_URL, json=new_object, timeout=TIMEOUT)
     
     if response.status_code in [200, 201]:  # 201 = Created
         created = response.json()
-        print(f"\n✅ Object created successfully!")
-        print(f"  New ID: {created.get('id')}")
-        print(f"  Name: {created.get('name')}")
-        print(f"  Data: {created.get('data')}")
-        print(f"  Created at: {created.get('createdAt', 'N/A')}")
+        LOG.info("Created object %s", created.get('id'))
+        if verbose:
+            print(f"\n✅ Object created successfully!")
+            print(f"  New ID: {created.get('id')}")
+            print(f"  Name: {created.get('name')}")
+            print(f"  Data: {created.get('data')}")
+            print(f"  Created at: {created.get('createdAt', 'N/A')}")
+        return created
+    else:
+        LOG.warning("Could not create object: HTTP %d", response.status_code)
+        if verbose:
+            print(f"❌ Error: Could not create object. Status code: {response.status_code}")
+            print(f"Response: {response.text}")
+        return None
+
+
+def create_objects_bulk(items, verbose=False):
+    """
+    POST many new objects in a single request.
+    
+    This is like handing over a whole list at once instead of one item per
+    trip: "Please add ALL of these to your database!"
+    Each item is a dict like {"name": ..., "data": ...}.
+    """
+    items = list(items)
+    if verbose:
+        _banner(f"➕ CREATING {len(items)} OBJECTS IN ONE REQUEST")
+    
+    url = f"{API_URL}:batch"
+    response = SESSION.post(url, json=items, timeout=TIMEOUT)
+    
+    if response.status_code in [200, 201]:
+        created = response.json()
+        LOG.info("Created %d objects", len(created))
+        if verbose:
+            print(f"✅ Created {len(created)} objects!\n")
+            for obj in created:
+                print(f"  New ID: {obj.get('id')} → {obj.get('name')}")
         return created
     else:
-        print(f"❌ Error: Could not create object. Status code: {response.status_code}")
-        print(f"Response: {response.text}")
+        LOG.warning("Could not create objects: HTTP %d", response.status_code)
+        if verbose:
+            print(f"❌ Error: Could not create objects. Status code: {response.status_code}")
+            print(f"Response: {response.text}")
         return None
 
 
-def update_object(object_id, name, data=None):
+def update_object(object_id, name, data=None, verbose=False):
     """
     PUT to update an existing object (replaces the entire object).
     
     This is like saying: "Replace everything about this item with new info!"
     """
-    print("\n" + "=" * 50)
-    print(f"✏️ UPDATING OBJECT WITH ID: {object_id}")
-    print("=" * 50)
+    if verbose:
+        _banner(f"✏️ UPDATING OBJECT WITH ID: {object_id}")
     
     url = f"{API_URL}/{object_id}"
     updated_data = {
@@ -148,34 +341,38 @@ def update_object(object_id, name, data=None):
         "data": data
     }
     
-    print(f"Sending update: {updated_data}")
+    if verbose:
+        print(f"Sending update: {updated_data}")
     
-    response = requests.put(url, json=updated_data)
+    response = SESSION.put(url, json=updated_data, timeout=TIMEOUT)
     
     if response.status_code == 200:
         updated = response.json()
-        print(f"\n✅ Object updated successfully!")
-        print(f"  ID: {updated.get('id')}")
-        print(f"  Name: {updated.get('name')}")
-        print(f"  Data: {updated.get('data')}")
-        print(f"  Updated at: {updated.get('updatedAt', 'N/A')}")
+        LOG.info("Updated object %s", object_id)
+        if verbose:
+            print(f"\n✅ Object updated successfully!")
+            print(f"  ID: {updated.get('id')}")
+            print(f"  Name: {updated.get('name')}")
+            print(f"  Data: {updated.get('data')}")
+            print(f"  Updated at: {updated.get('updatedAt', 'N/A')}")
         return updated
     else:
-        print(f"❌ Error: Could not update object. Status code: {response.status_code}")
-        print(f"Response: {response.text}")
+        LOG.warning("Could not update object %s: HTTP %d", object_id, response.status_code)
+        if verbose:
+            print(f"❌ Error: Could not update object. Status code: {response.status_code}")
+            print(f"Response: {response.text}")
         return None
 
 
-def patch_object(object_id, name=None, data=None):
+def patch_object(object_id, name=None, data=None, verbose=False):
     """
     PATCH to partially update an existing object.
     
     This is like saying: "Just change these specific things, keep the rest!"
     Unlike PUT, PATCH only updates the fields you specify.
     """
-    print("\n" + "=" * 50)
-    print(f"🔧 PATCHING OBJECT WITH ID: {object_id}")
-    print("=" * 50)
+    if verbose:
+        _banner(f"🔧 PATCHING OBJECT WITH ID: {object_id}")
     
     url = f"{API_URL}/{object_id}"
     patch_data = {}
@@ -185,46 +382,54 @@ def patch_object(object_id, name=None, data=None):
     if data is not None:
         patch_data["data"] = data
     
-    print(f"Sending patch: {patch_data}")
+    if verbose:
+        print(f"Sending patch: {patch_data}")
     
-    response = requests.patch(url, json=patch_data)
+    response = SESSION.patch(url, json=patch_data, timeout=TIMEOUT)
     
     if response.status_code == 200:
         patched = response.json()
-        print(f"\n✅ Object patched successfully!")
-        print(f"  ID: {patched.get('id')}")
-        print(f"  Name: {patched.get('name')}")
-        print(f"  Data: {patched.get('data')}")
-        print(f"  Updated at: {patched.get('updatedAt', 'N/A')}")
+        LOG.info("Patched object %s", object_id)
+        if verbose:
+            print(f"\n✅ Object patched successfully!")
+            print(f"  ID: {patched.get('id')}")
+            print(f"  Name: {patched.get('name')}")
+            print(f"  Data: {patched.get('data')}")
+            print(f"  Updated at: {patched.get('updatedAt', 'N/A')}")
         return patched
     else:
-        print(f"❌ Error: Could not patch object. Status code: {response.status_code}")
-        print(f"Response: {response.text}")
+        LOG.warning("Could not patch object %s: HTTP %d", object_id, response.status_code)
+        if verbose:
+            print(f"❌ Error: Could not patch object. Status code: {response.status_code}")
+            print(f"Response: {response.text}")
         return None
 
 
-def delete_object(object_id):
+def delete_object(object_id, verbose=False):
     """
     DELETE an object from the API.
     
     This is like saying: "Please remove this item from your database!"
     Be careful - this action cannot be undone!
     """
-    print("\n" + "=" * 50)
-    print(f"🗑️ DELETING OBJECT WITH ID: {object_id}")
-    print("=" * 50)
+    if verbose:
+        _banner(f"🗑️ DELETING OBJECT WITH ID: {object_id}")
     
     url = f"{API_URL}/{object_id}"
-    response = requests.delete(url)
+    response = SESSION.delete(url, timeout=TIMEOUT)
     
     if response.status_code == 200:
         result = response.json()
-        print(f"✅ Object deleted successfully!")
-        print(f"  Message: {result.get('message', 'Deleted')}")
+        LOG.info("Deleted object %s", object_id)
+        if verbose:
+            print(f"✅ Object deleted successfully!")
+            print(f"  Message: {result.get('message', 'Deleted')}")
         return True
     else:
-        print(f"❌ Error: Could not delete object. Status code: {response.status_code}")
-        print(f"Response: {response.text}")
+        LOG.warning("Could not delete object %s: HTTP %d", object_id, response.status_code)
+        if verbose:
+            print(f"❌ Error: Could not delete object. Status code: {response.status_code}")
+            print(f"Response: {response.text}")
         return False
 
 
@@ -245,11 +450,11 @@ def demo_all_operations():
     
     # 1. READ - Get all existing objects
     print("\n\n📖 STEP 1: Reading existing data...")
-    get_all_objects()
+    get_all_objects(verbose=True)
     
     # 2. READ - Get a single object
     print("\n\n📖 STEP 2: Reading a single object...")
-    get_single_object("1")
+    get_single_object("1", verbose=True)
     
     # 3. CREATE - Add a new object
     print("\n\n📝 STEP 3: Creating a new object...")
@@ -260,7 +465,8 @@ def demo_all_operations():
             "price": 999.99,
             "color": "Space Gray",
             "purpose": "Learning Python APIs!"
-        }
+        },
+        verbose=True
     )
     
     # If creation was successful, continue with update and delete
@@ -277,19 +483,21 @@ def demo_all_operations():
                 "price": 899.99,  # On sale!
                 "color": "Midnight Black",
                 "purpose": "Mastering Python APIs!"
-            }
+            },
+            verbose=True
         )
         
         # 5. PATCH - Partially update the object
         print("\n\n🔧 STEP 5: Patching just the name...")
         patch_object(
             object_id=new_id,
-            name="Super Learning Laptop Pro"
+            name="Super Learning Laptop Pro",
+            verbose=True
         )
         
         # 6. DELETE - Remove the object
         print("\n\n🗑️ STEP 6: Deleting our test object...")
-        delete_object(new_id)
+        delete_object(new_id, verbose=True)
     
     print("\n\n" + "🎉" * 25)
     print("   DEMO COMPLETE!")
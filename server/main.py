@@ -3,29 +3,43 @@ FastAPI Server - Learning to CREATE APIs with Python
 =====================================================
 
 This is a simple REST API server that mimics https://api.restful-api.dev/objects
-Data is stored in memory (a Python list), so it resets when the server restarts.
+Data is stored in memory (a Python dict), so it resets when the server restarts.
 
 Endpoints:
 - GET    /objects        → Get all objects
+- GET    /objects.ndjson → Stream all objects, one JSON object per line
 - GET    /objects/{id}   → Get one object by ID
 - POST   /objects        → Create a new object
+- POST   /objects:batch  → Create many objects in one request
 - PUT    /objects/{id}   → Replace an object entirely
 - PATCH  /objects/{id}   → Update specific fields of an object
 - DELETE /objects/{id}   → Delete an object
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import Message, Receive, Scope, Send
 from typing import Optional, Any
-from datetime import datetime
-import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import threading
+import time
+from secrets import token_hex
+
+import orjson
 
 # Create the FastAPI application
 app = FastAPI(
     title="API Playground Server",
     description="A simple REST API for learning - mimics api.restful-api.dev",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson turns Python objects into JSON much faster than the built-in json
+    default_response_class=ORJSONResponse,
 )
 
 # Allow requests from any origin (for development/learning)
@@ -38,6 +52,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Streamed responses: one JSON object per line (see GET /objects.ndjson)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class StreamFriendlyGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves NDJSON streams uncompressed.
+    
+    gzip collects streamed lines until it has a whole compressed block,
+    so clients would get nothing until the end - defeating the stream.
+    """
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("Accept-Encoding", ""):
+            await self.app(scope, receive, send)
+            return
+        
+        responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+        responder.send = send
+        forward = responder.send_with_gzip
+        
+        async def send_compressed_unless_ndjson(message: Message) -> None:
+            nonlocal forward
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                if content_type.startswith(NDJSON_MEDIA_TYPE):
+                    forward = send  # skip gzip, send lines as they come
+            await forward(message)
+        
+        await self.app(scope, receive, send_compressed_unless_ndjson)
+
+
+# Compress responses for clients that send "Accept-Encoding: gzip".
+# JSON shrinks a lot, and tiny responses aren't worth the effort.
+app.add_middleware(StreamFriendlyGZipMiddleware, minimum_size=512, compresslevel=5)
+
 
 # =============================================================================
 # DATA MODELS (Pydantic)
@@ -80,10 +130,21 @@ class ObjectResponse(BaseModel):
 # =============================================================================
 # IN-MEMORY DATABASE
 # =============================================================================
-# This list stores all our objects. It resets when the server restarts.
+# A dict stores all our objects, keyed by ID, so looking one up is a
+# single dict access instead of a scan through a list. Dicts remember
+# insertion order, so GET /objects still lists them in creation order.
+# It resets when the server restarts.
 # In a real app, you'd use a database like PostgreSQL, MongoDB, etc.
-
-objects_db: list[dict] = [
+#
+# FastAPI runs our endpoints on several threads at once, so a write could
+# happen while another request is reading. To keep reads safe WITHOUT
+# making them wait for a lock, we use "copy-on-write":
+# - The current data lives in a Snapshot that is never changed once published.
+# - Readers just grab the current Snapshot and use it.
+# - Writers take a lock (one writer at a time), build a changed COPY, and
+#   then swap in a new Snapshot in a single step.
+
+_seed_objects: list[dict] = [
     {
         "id": "1",
         "name": "Google Pixel 6 Pro",
@@ -152,21 +213,99 @@ objects_db: list[dict] = [
 ]
 
 
+# =============================================================================
+# RESPONSE CACHING (ETag)
+# =============================================================================
+# An ETag is a "version label" for our data. We send it with every GET, and
+# clients can send it back in an If-None-Match header. If nothing changed
+# since then we answer 304 Not Modified with no body, and the client reuses
+# the copy it already has. Every Snapshot gets a brand new label.
+#
+# We also keep the JSON we last sent as ready-made bytes, so repeated GETs
+# don't have to turn the same objects into JSON again.
+
+def make_etag() -> str:
+    """Create a fresh, unique ETag value"""
+    return f'"{token_hex(16)}"'
+
+
+@dataclass(eq=False)
+class Snapshot:
+    """One version of the database - replaced by writers, never modified"""
+    objects: dict[str, dict]
+    etag: str = field(default_factory=make_etag)
+    all_json: bytes | None = None  # JSON body of GET /objects, built on first use
+
+
+_snapshot = Snapshot({obj["id"]: obj for obj in _seed_objects})
+_write_lock = threading.Lock()
+
+# JSON body of GET /objects/{id}, stored as (object, bytes). The bytes are
+# only reused while the snapshot still holds that exact object.
+_cached_one: dict[str, tuple[dict, bytes]] = {}
+
+# The most objects POST /objects:batch accepts in one request
+MAX_BATCH_SIZE = 100
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
 def find_object_by_id(object_id: str) -> dict | None:
     """Find an object in our database by its ID"""
-    for obj in objects_db:
-        if obj["id"] == object_id:
-            return obj
-    return None
+    return _snapshot.objects.get(object_id)
+
+
+def publish(objects: dict[str, dict]) -> None:
+    """Make 'objects' the new current data (call while holding _write_lock)"""
+    global _snapshot
+    _snapshot = Snapshot(objects)
+
+
+def get_cache_headers(snapshot: Snapshot) -> dict[str, str]:
+    """Headers that let clients cache GET responses and revalidate them"""
+    return {
+        # "W/" = weak: the same data may be sent gzipped or not
+        "ETag": f"W/{snapshot.etag}",
+        # "no-cache" = you may keep a copy, but ask us (If-None-Match) first
+        "Cache-Control": "no-cache",
+    }
+
+
+def is_not_modified(request: Request, snapshot: Snapshot) -> bool:
+    """True if the client already has this version of our data"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or snapshot.etag in tags
+
+
+def json_response(content: bytes, snapshot: Snapshot) -> Response:
+    """Wrap already-encoded JSON in a response with our cache headers"""
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers=get_cache_headers(snapshot),
+    )
+
+
+# The "YYYY-MM-DDTHH:MM:SS" part only changes once a second, so we format it
+# once and reuse it for every write made during that second.
+# Stored as one (second, text) pair so both always change together.
+_timestamp_cache: tuple[int, str] = (-1, "")
 
 
 def get_timestamp() -> str:
     """Get current timestamp in ISO format"""
-    return datetime.utcnow().isoformat() + "+00:00"
+    global _timestamp_cache
+    second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{nanoseconds // 1000:06d}+00:00"
 
 
 # =============================================================================
@@ -183,8 +322,10 @@ def root():
         "docs": "/docs",
         "endpoints": {
             "GET /objects": "Get all objects",
+            "GET /objects.ndjson": "Stream all objects (one per line)",
             "GET /objects/{id}": "Get one object",
             "POST /objects": "Create new object",
+            "POST /objects:batch": "Create many objects at once",
             "PUT /objects/{id}": "Update entire object",
             "PATCH /objects/{id}": "Partial update",
             "DELETE /objects/{id}": "Delete object"
@@ -192,26 +333,69 @@ def root():
     }
 
 
-@app.get("/objects", response_model=list[ObjectResponse])
-def get_all_objects():
+@app.get(
+    "/objects",
+    # Documents the shape without validating it: our data is already valid
+    responses={200: {"model": list[ObjectResponse]}, 304: {"description": "Not Modified"}},
+)
+def get_all_objects(request: Request):
     """
     GET all objects
     
     Returns the complete list of objects in our database.
+    Answers 304 Not Modified if the client's ETag is still current.
     This is equivalent to: GET https://api.restful-api.dev/objects
     """
-    return objects_db
+    snapshot = _snapshot  # one consistent version, even if a write happens now
+    
+    if is_not_modified(request, snapshot):
+        return Response(status_code=304, headers=get_cache_headers(snapshot))
+    
+    # Our stored objects are already valid, so we hand them straight to
+    # orjson - and only once per snapshot
+    if snapshot.all_json is None:
+        snapshot.all_json = orjson.dumps(list(snapshot.objects.values()))
+    
+    return json_response(snapshot.all_json, snapshot)
 
 
-@app.get("/objects/{object_id}", response_model=ObjectResponse)
-def get_single_object(object_id: str):
+@app.get("/objects.ndjson")
+def stream_all_objects():
+    """
+    GET all objects as a stream (NDJSON = newline-delimited JSON)
+    
+    Sends one JSON object per line, as soon as each one is ready, instead of
+    one big JSON array at the end. Clients can start reading right away.
+    """
+    # Snapshots never change, so writes during the stream can't affect it
+    snapshot = _snapshot
+    
+    def generate_lines():
+        for obj in snapshot.objects.values():
+            yield orjson.dumps(obj) + b"\n"
+    
+    return StreamingResponse(
+        generate_lines(),
+        media_type=NDJSON_MEDIA_TYPE,
+        # Meant to be read once, as it arrives - don't store it
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+@app.get(
+    "/objects/{object_id}",
+    responses={200: {"model": ObjectResponse}, 304: {"description": "Not Modified"}},
+)
+def get_single_object(object_id: str, request: Request):
     """
     GET a single object by ID
     
     Returns one object if found, or 404 error if not found.
+    Answers 304 Not Modified if the client's ETag is still current.
     This is equivalent to: GET https://api.restful-api.dev/objects/{id}
     """
-    obj = find_object_by_id(object_id)
+    snapshot = _snapshot
+    obj = snapshot.objects.get(object_id)
     
     if obj is None:
         raise HTTPException(
@@ -219,7 +403,14 @@ def get_single_object(object_id: str):
             detail=f"Object with id '{object_id}' not found"
         )
     
-    return obj
+    if is_not_modified(request, snapshot):
+        return Response(status_code=304, headers=get_cache_headers(snapshot))
+    
+    cached = _cached_one.get(object_id)
+    if cached is None or cached[0] is not obj:
+        cached = _cached_one[object_id] = (obj, orjson.dumps(obj))
+    
+    return json_response(cached[1], snapshot)
 
 
 @app.post("/objects", response_model=ObjectResponse, status_code=200)
@@ -231,7 +422,7 @@ def create_object(new_object: ObjectCreate):
     This is equivalent to: POST https://api.restful-api.dev/objects
     """
     # Generate a unique ID (similar to the real API)
-    new_id = str(uuid.uuid4()).replace("-", "")[:32]
+    new_id = token_hex(16)
     
     # Create the new object
     created_object = {
@@ -242,11 +433,53 @@ def create_object(new_object: ObjectCreate):
     }
     
     # Add to our database
-    objects_db.append(created_object)
+    with _write_lock:
+        publish({**_snapshot.objects, new_id: created_object})
     
     return created_object
 
 
+@app.post("/objects:batch", response_model=list[ObjectResponse], status_code=200)
+def create_objects_batch(new_objects: list[ObjectCreate]):
+    """
+    POST - Create many objects in one request
+    
+    Accepts a list of {name, data} items and creates them all at once,
+    saving one HTTP round trip per object compared to calling POST /objects.
+    At most MAX_BATCH_SIZE items per request (413 error if there are more).
+    """
+    if len(new_objects) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"A batch can contain at most {MAX_BATCH_SIZE} objects, got {len(new_objects)}"
+        )
+    
+    # Nothing to add, so the data (and every client's cached copy) stays valid
+    if not new_objects:
+        return []
+    
+    # One timestamp for the whole batch: they were all created together
+    timestamp = get_timestamp()
+    
+    created_objects = [
+        {
+            "id": token_hex(16),
+            "name": new_object.name,
+            "data": new_object.data,
+            "createdAt": timestamp
+        }
+        for new_object in new_objects
+    ]
+    
+    # Add them all to our database
+    with _write_lock:
+        objects = dict(_snapshot.objects)
+        objects.update((obj["id"], obj) for obj in created_objects)
+        publish(objects)
+    
+    return created_objects
+
+
 @app.put("/objects/{object_id}", response_model=ObjectResponse)
 def update_object(object_id: str, updated_object: ObjectUpdate):
     """
@@ -255,20 +488,25 @@ def update_object(object_id: str, updated_object: ObjectUpdate):
     Replaces all fields of an existing object.
     This is equivalent to: PUT https://api.restful-api.dev/objects/{id}
     """
-    obj = find_object_by_id(object_id)
-    
-    if obj is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Object with id '{object_id}' not found"
-        )
-    
-    # Update the object
-    obj["name"] = updated_object.name
-    obj["data"] = updated_object.data
-    obj["updatedAt"] = get_timestamp()
+    with _write_lock:
+        obj = find_object_by_id(object_id)
+        
+        if obj is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Object with id '{object_id}' not found"
+            )
+        
+        # Build an updated copy - readers may still be using the old object
+        updated = {
+            **obj,
+            "name": updated_object.name,
+            "data": updated_object.data,
+            "updatedAt": get_timestamp()
+        }
+        publish({**_snapshot.objects, object_id: updated})
     
-    return obj
+    return updated
 
 
 @app.patch("/objects/{object_id}", response_model=ObjectResponse)
@@ -279,23 +517,28 @@ def patch_object(object_id: str, patch_data: ObjectPatch):
     Only updates the fields that are provided.
     This is equivalent to: PATCH https://api.restful-api.dev/objects/{id}
     """
-    obj = find_object_by_id(object_id)
-    
-    if obj is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Object with id '{object_id}' not found"
-        )
+    with _write_lock:
+        obj = find_object_by_id(object_id)
+        
+        if obj is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Object with id '{object_id}' not found"
+            )
+        
+        # Build an updated copy - readers may still be using the old object
+        patched = dict(obj)
+        
+        # Only update fields that were provided
+        if patch_data.name is not None:
+            patched["name"] = patch_data.name
+        if patch_data.data is not None:
+            patched["data"] = patch_data.data
+        
+        patched["updatedAt"] = get_timestamp()
+        publish({**_snapshot.objects, object_id: patched})
     
-    # Only update fields that were provided
-    if patch_data.name is not None:
-        obj["name"] = patch_data.name
-    if patch_data.data is not None:
-        obj["data"] = patch_data.data
-    
-    obj["updatedAt"] = get_timestamp()
-    
-    return obj
+    return patched
 
 
 @app.delete("/objects/{object_id}")
@@ -306,16 +549,19 @@ def delete_object(object_id: str):
     Removes an object from the database.
     This is equivalent to: DELETE https://api.restful-api.dev/objects/{id}
     """
-    obj = find_object_by_id(object_id)
-    
-    if obj is None:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Object with id '{object_id}' not found"
-        )
+    with _write_lock:
+        if find_object_by_id(object_id) is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Object with id '{object_id}' not found"
+            )
+        
+        # Remove from (a copy of) the database
+        objects = dict(_snapshot.objects)
+        del objects[object_id]
+        publish(objects)
     
-    # Remove from database
-    objects_db.remove(obj)
+    _cached_one.pop(object_id, None)
     
     return {
         "message": f"Object with id = {object_id} has been deleted."
@@ -329,9 +575,21 @@ def delete_object(object_id: str):
 # In production (Render), uvicorn runs the app directly
 
 if __name__ == "__main__":
+    import os
     import uvicorn
+    
+    # Each worker is a separate process with its OWN copy of the database,
+    # so an object created via one worker is invisible to the others.
+    # That's why we default to 1; set WEB_CONCURRENCY to try more.
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    
     print("\n🚀 Starting API Playground Server...")
     print("📚 API Docs: http://localhost:8000/docs")
     print("🔗 Objects: http://localhost:8000/objects\n")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",          # an import string is required for workers > 1
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+    )
 